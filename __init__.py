@@ -1,15 +1,20 @@
-from typing import Any, Optional, Type
+from contextlib import contextmanager
+from typing import Any, List, Optional, Type
 
 from .core._runtime import scope as _scope
-from .core._runtime.scope import SingletonScope, PrototypeScope
-from .core.exceptions import AlreadyStarted, NotStarted
+from .core._runtime.scope import SingletonScope, PrototypeScope, KeyedScope, WeakScope, ContextScope
+from .core.exceptions import AlreadyStarted, NotStarted, ScopeNotFound
 from .core._runtime.config import config as _config
 from .core._build.builder import builder as _builder
 from .core._prepare.register import register as _register
 from .core._runtime.context import context as _context
 from .core.base import Singleton as _Singleton
-from .core.base import Lazy, Volatile, Group, Strategy
-from .core.decorators import component, interface, strategy, factory
+from .core.base import Lazy, Volatile, Group, Strategy, Prefetch, Value, Scoped
+from .core._runtime.prefetch import set_executor as set_prefetch_executor
+from .core._runtime.profile import profiler as _profiler
+from .core._runtime.trace import tracer
+from .core._runtime.memory import memory_report, allocation_tracker as _allocation_tracker
+from .core.decorators import component, interface, strategy, factory, inject
 
 _started = False
 _configured = False
@@ -24,11 +29,20 @@ def configure(*, active_environ="prod", default_environ="prod"):
     _config.default_environ = default_environ
 
 
-def add_file_config(filename: str):
-    pass
+def add_scope(name: str, scope: _scope.BaseScope):
+    if _started:
+        raise AlreadyStarted
+    scope.enter()
+    _register.register_scope(name, scope)
+
 
+def add_file_config(filename: str, environ: Optional[str] = None):
+    if _started:
+        raise AlreadyStarted
+    _config.add_file(filename, environ)
 
-def start():
+
+def start(*, sealed: bool = False, profile: Optional[str] = None):
     global context
     global _started
     if _started:
@@ -37,7 +51,14 @@ def start():
         configure()
     _builder._context = _context
     _builder._config = _config
-    _builder.build()
+    with tracer.span("start"):
+        with tracer.span("load_config"):
+            _config.load()
+        with tracer.span("build"):
+            _builder.build()
+        if sealed:
+            with tracer.span("seal"):
+                _builder.seal()
     _builder.finalize()
     _config.finalize()
     _register.finalize()
@@ -45,6 +66,41 @@ def start():
     context._context = _context
     print(f"{context._context=}")
     _started = True  
+    if profile:
+        _profiler.start(profile)
+        hot = [c for c in _profiler.hot_components(_register.components)
+               if isinstance(_register.get_scope(c.scope), SingletonScope)]
+        with tracer.span("warm_up"):
+            _profiler.warm_up(hot, _context._get_instance)
+
+
+@contextmanager
+def scope(name: str = "request"):
+    context_scope = _register.scopes.get(name)
+    if not isinstance(context_scope, ContextScope):
+        raise ScopeNotFound(f"Context scope {name} not registered")
+    token = context_scope.open()
+    try:
+        yield
+    finally:
+        context_scope.close(token)
+
+
+def load_components():
+    if not _started:
+        raise NotStarted
+    return [c.cls for c in _builder.extend()]
+
+
+def track_allocations(enabled: bool = True):
+    if enabled:
+        _allocation_tracker.start()
+    else:
+        _allocation_tracker.stop()
+
+
+def save_profile(filename: Optional[str] = None):
+    _profiler.save(filename)
 
 
 class Context(_Singleton):
@@ -66,6 +122,14 @@ class Context(_Singleton):
         for instance in self._context.get_instances(interface, group):
             yield instance
 
+    def get_instances_bulk(self, *,
+                           interface: Optional[Type] = None,
+                           name: Optional[str] = None,
+                           group: Optional[str] = None,
+                           count: int,
+                           **kwargs) -> List[Any]:
+        return self._context.get_instances_bulk(interface, name, group, count, **kwargs)
+
 def get_context():
     if not _started:
         raise NotStarted
@@ -1,9 +1,13 @@
+import contextvars
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import ForwardRef, Optional, get_origin, get_args, Any, Type
+from typing import ForwardRef, Optional, get_origin, get_args, Any, Type, List
 
-from ..base import Group, Lazy, Singleton, Component, Dependency, ALL, Volatile, Strategy
+from ..base import Group, Lazy, Singleton, Component, Dependency, ALL, Volatile, Strategy, Prefetch, Value, \
+    Scoped
 from .._prepare.register import register
+from .._runtime.prefetch import get_executor
+from .._runtime.trace import tracer
 from ..exceptions import  ImproperlyConfigured, MoreThanOneCandidateFound, InconsistentGroup, ScopeNotFound, NoCandidatesFound, \
     AttributeWasNotInjected
 
@@ -34,6 +38,15 @@ class SimpleDependency(BaseDependency):
         self.inject(instance, value)
 
 
+class SealedDependency(BaseDependency):
+
+    def __get__(self, instance: Any, owner: Type):
+        if instance is None:
+            return self
+        raise AttributeWasNotInjected(f"Attribute {self.name} of class {owner} "
+                                      f"was not injected into the object {instance}")
+
+
 
 class LazyDependency(BaseDependency):
 
@@ -48,6 +61,31 @@ class LazyDependency(BaseDependency):
         self.inject(value)
 
 
+class PrefetchedLazyDependency(LazyDependency):
+
+    def __init__(self, name: str, dependency: Dependency, context):
+        super().__init__(name, dependency, context)
+        self.future_name = f"__pydi_prefetch_{name}"
+
+    def prefetch(self, instance):
+        if self.name in instance.__dict__ or self.future_name in instance.__dict__:
+            return
+        future = get_executor().submit(contextvars.copy_context().run,
+                                       self.context.get_instance, self.dependency.interface)
+        instance.__dict__[self.future_name] = future
+
+    def __get__(self, instance: Any, owner: Type):
+        if self.name not in instance.__dict__:
+            future = instance.__dict__.get(self.future_name)
+            if future is None:
+                return super().__get__(instance, owner)
+            value = future.result()
+            self.inject(instance, value)
+            instance.__dict__.pop(self.future_name, None)
+            return value
+        return self.extract(instance)
+
+
 
 class LazyCollectionDependency(BaseDependency):
 
@@ -114,12 +152,10 @@ class BaseDependencyBuilder(ABC):
 class SimpleDependencyBuilder(BaseDependencyBuilder):
 
     def _is_my_dependency(self, typehint):
-        return self.origin is None
+        return self.origin is None and register.is_interface(typehint)
 
     def dependency(self):
         interface = self.typehint
-        if not register.is_interface(interface) or VarType:
-            return False
         return Dependency( interface=interface, 
                            inject_immidiately=True)
 
@@ -130,7 +166,10 @@ class SimpleDependencyBuilder(BaseDependencyBuilder):
 class CollectionDependencyBuilder(BaseDependencyBuilder):
 
     def _is_my_dependency(self, typehint):
-        return self.origin in (list, set) 
+        if self.origin not in (list, set):
+            return False
+        args = get_args(typehint)
+        return len(args) == 1 and register.is_interface(args[0])
 
     
     def dependency(self):
@@ -160,10 +199,16 @@ class LazyDependencyBuilder(BaseDependencyBuilder):
 
     def dependency(self):
         interface = self.child_type
+        if get_origin(interface) == Prefetch:
+            return Dependency(interface=get_args(interface)[0],
+                              is_lazy=True,
+                              prefetch=True)
         return Dependency(interface=interface,
                           is_lazy=True)
 
     def descriptor(self):
+        if get_origin(self.child_type) == Prefetch:
+            return PrefetchedLazyDependency
         return LazyDependency
 
 
@@ -179,7 +224,7 @@ class VolitiledencyBuilder(BaseDependencyBuilder):
         if child_origin in (list, set, tuple):
             raise ImproperlyConfigured(f"Volatile[{child_origin}]] dependencies are not supported")
 
-        return False
+        return True
 
 
     def dependency(self):
@@ -194,9 +239,11 @@ class VolitiledencyBuilder(BaseDependencyBuilder):
 class LazyCollectionDependencyBuilder(BaseDependencyBuilder):
 
     def _is_my_dependency(self, typehint):
+        if self.origin != Lazy:
+            return False
         self.child_type = get_args(typehint)[0]
         child_origin = get_origin(self.child_type)  
-        return self.origin == Lazy and child_origin in (list, set, tuple)
+        return child_origin in (list, set, tuple)
     
     def dependency(self):
         child_origin = get_origin(self.child_type)  
@@ -261,6 +308,49 @@ class StrategyDependencyBuilder(BaseDependencyBuilder):
     def descriptor(self):
         return SimpleDependency
 
+
+class ScopedDependencyBuilder(BaseDependencyBuilder):
+
+    def _is_my_dependency(self, typehint):
+        if self.origin != Scoped:
+            return False
+        child_origin = get_origin(get_args(typehint)[0])
+        if child_origin in (Lazy, Volatile, list, set, tuple):
+            raise ImproperlyConfigured(f"Scoped[{child_origin}] dependencies are not supported")
+        return True
+
+    def dependency(self):
+        interface = get_args(self.typehint)[0]
+        return Dependency(interface=interface,
+                          inject_immidiately=True,
+                          is_scoped=True)
+
+    def descriptor(self):
+        return SimpleDependency
+
+
+class ValueDependencyBuilder(BaseDependencyBuilder):
+
+    def _is_my_dependency(self, typehint):
+        if self.origin != Value:
+            return False
+        args = get_args(typehint)
+        if (len(args) != 2
+            or not isinstance(args[0], ForwardRef)
+            or not isinstance(args[0].__forward_arg__, str)):
+            raise ImproperlyConfigured(f"Value dependency arguments must be Value[key: str, type], {args} given")
+        return True
+
+    def dependency(self):
+        key, value_type = get_args(self.typehint)
+        return Dependency(config_key=key.__forward_arg__,
+                          config_type=value_type,
+                          inject_immidiately=True)
+
+    def descriptor(self):
+        return SimpleDependency
+
+
 def _parse_type_hint(typehint, result=None):
     origin = get_origin(typehint)
     result = result or ParsingResult()
@@ -273,7 +363,7 @@ def _parse_type_hint(typehint, result=None):
     children = get_args(typehint)
     if len(children) > 1:
         raise ImproperlyConfigured(f"One of Interface, Interface[Lazy], Interface[Volatile], "
-                                   f"List[Interface[Group["name"]]], List[Interface], Interface[Strategy["name"]] expected,
+                                   f"List[Interface[Group['name']]], List[Interface], Interface[Strategy['name']] expected, "
                                    f"but {typehint} given")
     nested = children[0]
     nested_origin = get_origin(nested)
@@ -290,7 +380,7 @@ def _parse_type_hint(typehint, result=None):
         result.use_strategy = True
     else:
         raise ImproperlyConfigured(f"One of Interface, Interface[Lazy], Interface[Volatile], "
-                                   f"List[Interface[Group["name"]]], List[Interface], Interface[Strategy["name"]] expected,
+                                   f"List[Interface[Group['name']]], List[Interface], Interface[Strategy['name']] expected, "
                                    f"but {typehint} given")
     return result
 
@@ -298,29 +388,42 @@ def _parse_type_hint(typehint, result=None):
 def _validate_type_hint(parsing_result):
     pass 
 
+_dependency_builders = (
+    ValueDependencyBuilder,
+    ScopedDependencyBuilder,
+    GroupDependancyBuilder,
+    LazyCollectionDependencyBuilder,
+    LazyDependencyBuilder,
+    VolitiledencyBuilder,
+    CollectionDependencyBuilder,
+    SimpleDependencyBuilder,
+)
+
+
 def get_dependency_builder(typehint):
-    parsing_result = _parse_type_hint(typehint)
-    if not parsing_result:
-        return
+    for builder_cls in _dependency_builders:
+        dependency_builder = builder_cls()
+        if dependency_builder.is_my_depependency(typehint):
+            return dependency_builder
     
 
 class Builder(Singleton):
 
+    __readonly__ = True
+
     def __init__(self) -> None:
         self._context = None
         self._config = None
+        self._sealed = False
         
 
+    def _is_active(self, component: Component):
+        if not component.environ:
+            component.environ = {self._config.default_environ}
+        return ALL in component.environ or self._config.active_environ in component.environ
+
     def _build_environment(self):
-        active_environ = self._config.active_environ
-        default_environ = self._config.default_environ
-        components = []
-        for component in register.components:
-            if not component.environ:
-                component.environ = {default_environ}
-            if ALL in component.environ or active_environ in component.environ:
-                components.append(component)
-        register.components = components
+        register.components = [c for c in register.components if self._is_active(c)]
 
 
     def _build_dependencies(self, component: Component):
@@ -339,6 +442,11 @@ class Builder(Singleton):
             component.dependencies[name] = (dependency, descriptor)
 
 
+    def _build_values(self, component: Component):
+        for dependency, _ in component.dependencies.values():
+            if dependency.config_key:
+                dependency.value = self._config.get_value(dependency.config_key, dependency.config_type)
+
     def _build_interfaces(self, component: Component):
         for interface in component.implements:
             register.interfaces[interface].append(component)
@@ -359,17 +467,21 @@ class Builder(Singleton):
         first = register.groups[group][0]
         if first is component:
             return
+        self._check_group(group, first, component)
+        register.groups.setdefault(group, []).append(component)
+
+    def _check_group(self, group: str, first: Component, component: Component):
         if set(first.dependencies) != set(component.dependencies):
             raise InconsistentGroup(f"Components in group {group} differ in their dependencies")
         if first.scope != component.scope:
             raise InconsistentGroup(f"Components in group {group} differ in their scope")
         if set(first.implements) != set(component.implements):
             raise InconsistentGroup(f"Components in group {group} differ in their interfaces")
-        register.groups.setdefault(group, []).append(component)
     
     def _build_factories(self, component: Component):
         if component.factory_name:
-            if register.get_factory(component.factory_name) is None:
+            if (register.get_factory(component.factory_name) is None
+                and register.get_batch_factory(component.factory_name) is None):
                 raise ImproperlyConfigured(f"Factory '{component.factory_name}'"
                  f"required for component {component} does not exist")
 
@@ -377,15 +489,70 @@ class Builder(Singleton):
         if component.scope not in register.scopes:
             raise ScopeNotFound(f"Scope {component.scope} for component {component.cls} not registered")
 
+    def _seal(self, components: List[Component]):
+        for component in components:
+            for name, (dependency, descriptor) in component.dependencies.items():
+                if type(descriptor) is not SimpleDependency:
+                    continue
+                sealed = SealedDependency(name=name, dependency=dependency, context=self._context)
+                setattr(component.cls, name, sealed)
+                component.dependencies[name] = (dependency, sealed)
+
+    def seal(self):
+        self._sealed = True
+        self._seal(register.components)
+
     def build(self):
-        self._build_environment()
+        with tracer.span("_build_environment"):
+            self._build_environment()
+        steps = (self._build_interfaces,
+                 self._build_dependencies,
+                 self._build_values,
+                 self._build_named_components,
+                 self._build_groups,
+                 self._build_scopes,
+                 self._build_factories)
+        if not tracer.enabled:
+            for component in register.components:
+                for step in steps:
+                    step(component)
+            return
         for component in register.components:
-            self._build_interfaces(component)
+            for step in steps:
+                with tracer.span(step.__name__, component=component.cls.__qualname__):
+                    step(component)
+
+    def extend(self) -> List[Component]:
+        with register.lock:
+            return self._extend(register.take_pending())
+
+    def _extend(self, pending: List[Component]) -> List[Component]:
+        components = [c for c in pending if self._is_active(c)]
+        interfaces = dict(register.interfaces)
+        named_components = dict(register.named_components)
+        groups = dict(register.groups)
+        for component in components:
             self._build_dependencies(component)
-            self._build_named_components(component)
-            self._build_groups(component)
+            self._build_values(component)
             self._build_scopes(component)
             self._build_factories(component)
+            for interface in component.implements:
+                interfaces[interface] = interfaces.get(interface, []) + [component]
+            if name := component.name:
+                if name in named_components:
+                    raise MoreThanOneCandidateFound(f"More than one named component found, {name}")
+                named_components[name] = component
+            if group := component.group:
+                if group in groups:
+                    self._check_group(group, groups[group][0], component)
+                groups[group] = groups.get(group, []) + [component]
+        if self._sealed:
+            self._seal(components)
+        register.publish(interfaces=interfaces,
+                         named_components=named_components,
+                         groups=groups,
+                         components=register.components + components)
+        return components
 
 
 builder = Builder()
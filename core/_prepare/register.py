@@ -1,4 +1,5 @@
-from typing import Dict, Optional, Type, List, Iterator, Protocol, Any
+import threading
+from typing import Dict, Optional, Type, List, Iterator, Iterable, Protocol, Any
 from ..base import Component, Singleton, Scope
 from ..exceptions import ScopeRedeclaration, GroupFactoryNotFound, GroupNotFound
 
@@ -8,6 +9,11 @@ class Factory(Protocol):
         ...
 
 
+class BatchFactory(Protocol):
+    def __call__(self, cls: Type, count: int, *args, **kwargs) -> Iterable:
+        ...
+
+
 class Strategy(Protocol):
     def __call__(self, *args, **kwargs) -> Type:
         ...
@@ -24,13 +30,30 @@ class Register(Singleton):
         self.components: List[Component] = []
         self.strategies: Dict[str, Strategy] = {}
         self.factories: Dict[str, Factory] = {}
+        self.batch_factories: Dict[str, BatchFactory] = {}
         self.scopes: Dict[str, Scope] = {}
+        self.pending: List[Component] = []
+        self.lock = threading.RLock()
 
     def register_interface(self, interface):
-        self.interfaces[interface] = []
+        with self.lock:
+            if interface in self.interfaces:
+                return
+            # copy on write, a running container may be reading the published index
+            interfaces = dict(self.interfaces)
+            interfaces[interface] = []
+            self.__dict__["interfaces"] = interfaces
 
     def register_component(self, component: Component):
-        self.components.append(component)
+        if self._finished:
+            self.pending.append(component)
+        else:
+            self.components.append(component)
+
+    def take_pending(self) -> List[Component]:
+        pending = self.pending[:]
+        del self.pending[:len(pending)]
+        return pending
 
     def register_strategy(self, group_name: str, func: Strategy):
         self.strategies[group_name] = func
@@ -38,11 +61,25 @@ class Register(Singleton):
     def register_factory(self, factory_name: str, func: Factory):
         self.factories[factory_name] = func
 
+    def register_batch_factory(self, factory_name: str, func: BatchFactory):
+        self.batch_factories[factory_name] = func
+
     def register_scope(self, name: str, scope: Scope):
         if name in self.scopes:
             raise ScopeRedeclaration(f"Scope {name} already registered")
         self.scopes[name] = scope
 
+    def publish(self, *,
+                interfaces: Dict[Type, List[Component]],
+                named_components: Dict[str, Component],
+                groups: Dict[str, List[Component]],
+                components: List[Component]):
+        # a single dict.update swaps all indexes at once, readers never see a mix of old and new
+        self.__dict__.update(interfaces=interfaces,
+                             named_components=named_components,
+                             groups=groups,
+                             components=components)
+
     def is_interface(self, cls: Type):
         return cls in self.interfaces
 
@@ -56,6 +93,9 @@ class Register(Singleton):
     def get_factory(self, factory_name: str) -> Optional[Factory]:
         return self.factories.get(factory_name)
 
+    def get_batch_factory(self, factory_name: str) -> Optional[BatchFactory]:
+        return self.batch_factories.get(factory_name)
+
     def get_strategy(self, group_name: str) -> Optional[Strategy]:
         return self.strategies(group_name)
 
@@ -1,15 +1,142 @@
-from typing import Set
+import configparser
+import copy
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, get_origin
+
+try:
+    import tomllib
+except ImportError:  # python < 3.11
+    tomllib = None
 
 from ..base import Singleton
+from ..exceptions import ImproperlyConfigured
+
+_MISSING = object()
+_TRUE = {"1", "true", "yes", "on"}
+_FALSE = {"0", "false", "no", "off"}
+
+_parsed: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+_parsed_lock = threading.Lock()
+
+
+def _parse_toml(filename: str) -> Dict[str, Any]:
+    if tomllib is None:
+        raise ImproperlyConfigured(f"TOML config {filename} requires python 3.11+")
+    with open(filename, "rb") as f:
+        return tomllib.load(f)
+
+
+def _parse_json(filename: str) -> Dict[str, Any]:
+    with open(filename) as f:
+        return json.load(f)
+
+
+def _parse_ini(filename: str) -> Dict[str, Any]:
+    parser = configparser.ConfigParser()
+    with open(filename) as f:
+        parser.read_file(f)
+    result: Dict[str, Any] = dict(parser.defaults())
+    for section in parser.sections():
+        result[section] = {key: parser.get(section, key) for key in parser.options(section)}
+    return result
+
+
+_parsers = {
+    ".toml": _parse_toml,
+    ".json": _parse_json,
+    ".ini": _parse_ini,
+    ".cfg": _parse_ini,
+}
+
+
+def parse_file(filename: str) -> Dict[str, Any]:
+    path = os.path.abspath(filename)
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _parsers:
+        raise ImproperlyConfigured(f"Unsupported config file format {filename}, "
+                                   f"one of {sorted(_parsers)} expected")
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        raise ImproperlyConfigured(f"Config file {filename} can not be read: {e}") from e
+    cached = _parsed.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    data = _parsers[extension](path)
+    if not isinstance(data, dict):
+        raise ImproperlyConfigured(f"Config file {filename} must contain a mapping at the top level")
+    with _parsed_lock:
+        _parsed[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
+
+def _merge(target: Dict[str, Any], source: Dict[str, Any]):
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        elif isinstance(value, dict):
+            target[key] = _merge({}, value)
+        else:
+            target[key] = value
+    return target
+
+
+def _coerce(key: str, value: Any, value_type: Optional[Type]):
+    if value_type is None or value_type is Any:
+        return value
+    target = get_origin(value_type) or value_type
+    if not isinstance(target, type):
+        raise ImproperlyConfigured(f"Config value '{key}' can not be checked against {value_type}")
+    if isinstance(value, target):
+        return value
+    if target is bool and isinstance(value, str):
+        if value.lower() in _TRUE:
+            return True
+        if value.lower() in _FALSE:
+            return False
+    try:
+        return target(value)
+    except (TypeError, ValueError) as e:
+        raise ImproperlyConfigured(f"Config value '{key}'={value!r} can not be converted "
+                                   f"to {value_type}") from e
 
 
 class Config(Singleton):
 
     __readonly__ = True
-    
+
     def __init__(self):
         self.active_environ: str = None
         self.default_environ: Set[str] = None
+        self.files: List[Tuple[str, Optional[str]]] = []
+        self.values: Dict[str, Any] = {}
+
+    def add_file(self, filename: str, environ: Optional[str] = None):
+        self.files.append((filename, environ))
+
+    def load(self):
+        environs = [None]
+        for environ in (self.default_environ, self.active_environ):
+            if environ not in environs:
+                environs.append(environ)
+        values = {}
+        for environ in environs:
+            for filename, file_environ in self.files:
+                if file_environ == environ:
+                    _merge(values, parse_file(filename))
+        self.values = copy.deepcopy(values)
+
+    def get_value(self, key: str, value_type: Optional[Type] = None, default: Any = _MISSING) -> Any:
+        value = self.values
+        for part in key.split("."):
+            if not isinstance(value, dict) or part not in value:
+                if default is not _MISSING:
+                    return default
+                raise ImproperlyConfigured(f"Config value '{key}' not found")
+            value = value[part]
+        return _coerce(key, value, value_type)
 
 
 config = Config()
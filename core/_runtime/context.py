@@ -1,23 +1,101 @@
-from typing import Type, Any, Iterator, Optional
+from typing import Type, Any, Iterator, List, Optional
 
 from ..base import Singleton, Component
 from .._prepare.register import register
+from .config import config
+from .profile import profiler
+from .proxy import proxy_class
+from .scope import PrototypeScope
+from .trace import tracer
 from ..exceptions import (NoCandidatesFound, WrongInstantiating, MoreThanOneCandidateFound,
                           IllegalContextCall)
 
 
+def _never(scope) -> bool:
+    return False
+
+
+def _is_shared(scope) -> bool:
+    return not isinstance(scope, PrototypeScope)
+
+
 class _Injector(Singleton):
 
+    def __init__(self):
+        if hasattr(self, "_proxies"):
+            return
+        self._proxies = {}
+
     def inject(self, component, instance):
         for dependency, descriptor in component.dependencies.values():
             if dependency.inject_immidiately:
-                if dependency.group:
+                if dependency.config_key:
+                    value = dependency.value
+                elif dependency.is_scoped:
+                    value = self._proxy(dependency.interface)
+                elif dependency.group:
                     value = dependency.collection(context.get_instances(group=dependency.group)) 
                 elif dependency.collection:
                     value = dependency.collection(context.get_instances(interface=dependency.interface))
                 else:
-                    value = self.get_instance(dependency.interface)
+                    value = context.get_instance(dependency.interface)
                 descriptor.inject(instance, value)
+            elif dependency.prefetch:
+                descriptor.prefetch(instance)
+
+    def _proxy(self, interface):
+        # load_components publishes a new candidate list, so a cached proxy is reused only while its list is current
+        candidates = register.interfaces.get(interface)
+        if (cached := self._proxies.get(interface)) is not None and cached[0] is candidates:
+            return cached[1]
+        component = context.get_component(interface)
+        scope = register.get_scope(component.scope)
+        get_cache = getattr(scope, "get_cache", lambda: None)
+        proxy = proxy_class(interface)(component.uid, get_cache, lambda: context._get_instance(component))
+        self._proxies[interface] = (candidates, proxy)
+        return proxy
+
+    def _getter(self, component, resolve_once):
+        if resolve_once(register.get_scope(component.scope)):
+            instance = context._get_instance(component)
+            return lambda: instance
+        return lambda: context._get_instance(component)
+
+    def _resolver(self, dependency, resolve_once=_never):
+        if dependency.config_key:
+            value = config.get_value(dependency.config_key, dependency.config_type)
+            return lambda: value
+        if dependency.is_scoped:
+            proxy = self._proxy(dependency.interface)
+            return lambda: proxy
+        if dependency.is_volatile:
+            resolve_once = _never
+        if dependency.group or dependency.collection:
+            components = list(context.get_components(interface=None if dependency.group else dependency.interface,
+                                                     group=dependency.group))
+            getters = [self._getter(c, resolve_once) for c in components]
+            return lambda: dependency.collection(get() for get in getters)
+        component = context.get_component(dependency.interface)
+        return self._getter(component, resolve_once)
+
+    def inject_many(self, component, instances):
+        plan = [(descriptor, self._resolver(dependency, _is_shared))
+                for dependency, descriptor in component.dependencies.values()
+                if dependency.inject_immidiately]
+        prefetched = [descriptor
+                      for dependency, descriptor in component.dependencies.values()
+                      if dependency.prefetch]
+        if not plan and not prefetched:
+            return
+        injected = set()
+        for instance in instances:
+            if id(instance) in injected:
+                continue
+            injected.add(id(instance))
+            for descriptor, resolve in plan:
+                descriptor.inject(instance, resolve())
+            for descriptor in prefetched:
+                descriptor.prefetch(instance)
 
 
 class Context(Singleton):
@@ -68,6 +146,15 @@ class Context(Singleton):
 
 
     def _get_instance(self, component: Component, **kwargs):
+        if tracer.enabled:
+            with tracer.span(f"resolve:{component.cls.__module__}.{component.cls.__qualname__}",
+                             scope=component.scope):
+                return self._resolve(component, **kwargs)
+        return self._resolve(component, **kwargs)
+
+    def _resolve(self, component: Component, **kwargs):
+        if profiler.enabled:
+            profiler.record_resolution(component)
         scope = register.get_scope(component.scope)
         instance = scope.get_instance(component, **kwargs)
         self.injector.inject(component, instance)
@@ -89,5 +176,31 @@ class Context(Singleton):
         for component in components:
             yield self._get_instance(component, **kwargs)
 
+    def _get_instances_bulk(self, component: Component, count: int, **kwargs) -> List[Any]:
+        if tracer.enabled:
+            with tracer.span(f"resolve:{component.cls.__module__}.{component.cls.__qualname__}",
+                             scope=component.scope, count=count):
+                return self._resolve_bulk(component, count, **kwargs)
+        return self._resolve_bulk(component, count, **kwargs)
+
+    def _resolve_bulk(self, component: Component, count: int, **kwargs) -> List[Any]:
+        if profiler.enabled:
+            profiler.record_resolution(component)
+        scope = register.get_scope(component.scope)
+        instances = scope.get_instances(component, count, **kwargs)
+        self.injector.inject_many(component, instances)
+        return instances
+
+    def get_instances_bulk(self,
+                           interface: Optional[Type] = None,
+                           name: Optional[str] = None,
+                           group: Optional[str] = None,
+                           count: int = 1,
+                           **kwargs) -> List[Any]:
+        if count < 0:
+            raise IllegalContextCall(f"Count must be non-negative, {count} given")
+        component = self.get_component(interface, name, group)
+        return self._get_instances_bulk(component, count, **kwargs)
+
 
 context = Context(_Injector())
@@ -0,0 +1,163 @@
+import csv
+import io
+import json
+import sys
+import threading
+import tracemalloc
+from dataclasses import dataclass, asdict
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Dict, List, Optional, Set
+
+from ..base import Component
+from .._prepare.register import register
+from .proxy import ScopedProxy
+
+_SKIPPED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType, ScopedProxy)
+
+
+@dataclass
+class Allocation:
+    last: int = 0
+    peak: int = 0
+    builds: int = 0
+
+
+class AllocationTracker:
+
+    def __init__(self):
+        self.enabled = False
+        self.allocations: Dict[int, Allocation] = {}
+        self._started_tracing = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @staticmethod
+    def current() -> int:
+        return tracemalloc.get_traced_memory()[0]
+
+    def record(self, component: Component, size: int, count: int = 1):
+        if count <= 0:
+            return
+        size //= count
+        with self._lock:
+            if (allocation := self.allocations.get(component.uid)) is None:
+                allocation = self.allocations.setdefault(component.uid, Allocation())
+            allocation.last = size
+            allocation.peak = max(allocation.peak, size)
+            allocation.builds += count
+
+
+allocation_tracker = AllocationTracker()
+
+
+def deep_sizeof(obj: Any, seen: Set[int]) -> int:
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SKIPPED):
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item, 0)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        try:
+            stack.append(object.__getattribute__(item, "__dict__"))
+        except (AttributeError, TypeError):
+            pass
+        for cls in type(item).__mro__:
+            slots = getattr(cls, "__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if slot in ("__dict__", "__weakref__"):
+                    continue
+                try:
+                    stack.append(object.__getattribute__(item, slot))
+                except AttributeError:
+                    pass
+    return size
+
+
+@dataclass
+class ComponentMemory:
+    component: str
+    scope: str
+    instances: int = 0
+    retained_size: int = 0
+    allocated_size: Optional[int] = None
+    allocated_peak: Optional[int] = None
+    builds: int = 0
+
+
+@dataclass
+class MemoryReport:
+    components: List[ComponentMemory]
+    scopes: Dict[str, int]
+    total: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"total": self.total,
+                "scopes": dict(self.scopes),
+                "components": [asdict(c) for c in self.components]}
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_csv(self) -> str:
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=list(ComponentMemory.__dataclass_fields__))
+        writer.writeheader()
+        for component in self.components:
+            writer.writerow(asdict(component))
+        return output.getvalue()
+
+
+def _component_name(component: Component) -> str:
+    return f"{component.cls.__module__}.{component.cls.__qualname__}"
+
+
+def memory_report() -> MemoryReport:
+    components = {c.uid: c for c in register.components}
+    cached = [(name, uid, instance)
+              for name, scope in list(register.scopes.items())
+              for uid, instance in scope.cached_instances()
+              if uid in components]
+    seen = {id(instance) for _, _, instance in cached}
+    walked: Set[int] = set()
+    entries: Dict[int, ComponentMemory] = {}
+    for scope_name, uid, instance in cached:
+        entry = entries.setdefault(uid, ComponentMemory(component=_component_name(components[uid]),
+                                                        scope=scope_name))
+        entry.instances += 1
+        if id(instance) in walked:
+            continue
+        walked.add(id(instance))
+        seen.discard(id(instance))
+        entry.retained_size += deep_sizeof(instance, seen)
+    for uid, allocation in list(allocation_tracker.allocations.items()):
+        if uid not in components:
+            continue
+        component = components[uid]
+        entry = entries.setdefault(uid, ComponentMemory(component=_component_name(component),
+                                                        scope=component.scope))
+        entry.allocated_size = allocation.last
+        entry.allocated_peak = allocation.peak
+        entry.builds = allocation.builds
+    scopes: Dict[str, int] = {}
+    for entry in entries.values():
+        scopes[entry.scope] = scopes.get(entry.scope, 0) + entry.retained_size
+    ordered = sorted(entries.values(), key=lambda e: (e.retained_size, e.allocated_size or 0), reverse=True)
+    return MemoryReport(components=ordered, scopes=scopes, total=sum(scopes.values()))
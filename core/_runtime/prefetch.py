@@ -0,0 +1,21 @@
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional
+
+_executor: Optional[Executor] = None
+_lock = threading.Lock()
+
+
+def get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(thread_name_prefix="pydi-prefetch")
+    return _executor
+
+
+def set_executor(executor: Executor):
+    global _executor
+    with _lock:
+        _executor = executor
@@ -0,0 +1,132 @@
+import atexit
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional
+
+from ..base import Component
+
+PROFILE_VERSION = 1
+
+
+@dataclass
+class ComponentUsage:
+    resolutions: int = 0
+    first_resolution: Optional[float] = None
+    builds: int = 0
+    build_time: float = 0.0
+
+
+def component_key(component: Component) -> str:
+    return f"{component.cls.__module__}.{component.cls.__qualname__}"
+
+
+class Profiler:
+
+    def __init__(self):
+        self.enabled = False
+        self.filename: Optional[str] = None
+        self.hot_window = 5.0
+        self.hot_resolutions = 2
+        self.usage: Dict[str, ComponentUsage] = {}
+        self.previous: Dict[str, ComponentUsage] = {}
+        self._started_at = None
+        self._warming = False
+        self._lock = threading.Lock()
+
+    def start(self, filename: str):
+        self.filename = filename
+        self.previous = self.load(filename)
+        self.usage = {}
+        self._started_at = time.perf_counter()
+        self.enabled = True
+        atexit.register(self.save)
+
+    def _usage(self, component: Component) -> ComponentUsage:
+        key = component_key(component)
+        if (usage := self.usage.get(key)) is None:
+            usage = self.usage.setdefault(key, ComponentUsage())
+        return usage
+
+    def record_resolution(self, component: Component):
+        if self._warming:
+            return
+        with self._lock:
+            usage = self._usage(component)
+            usage.resolutions += 1
+            if usage.first_resolution is None:
+                usage.first_resolution = time.perf_counter() - self._started_at
+
+    def record_build(self, component: Component, elapsed: float, count: int = 1):
+        with self._lock:
+            usage = self._usage(component)
+            usage.builds += count
+            usage.build_time += elapsed
+
+    def is_hot(self, usage: ComponentUsage) -> bool:
+        if usage.resolutions >= self.hot_resolutions:
+            return True
+        return usage.first_resolution is not None and usage.first_resolution <= self.hot_window
+
+    def hot_components(self, components: Iterable[Component]) -> List[Component]:
+        hot = [c for c in components
+               if (usage := self.previous.get(component_key(c))) and self.is_hot(usage)]
+        return _dependency_order(hot)
+
+    def warm_up(self, components: Iterable[Component], build):
+        self._warming = True
+        try:
+            for component in components:
+                build(component)
+        finally:
+            self._warming = False
+
+    @staticmethod
+    def load(filename: str) -> Dict[str, ComponentUsage]:
+        try:
+            with open(filename) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != PROFILE_VERSION:
+            return {}
+        return {key: ComponentUsage(**usage) for key, usage in data.get("components", {}).items()}
+
+    def save(self, filename: Optional[str] = None):
+        filename = filename or self.filename
+        if not filename:
+            return
+        with self._lock:
+            data = {"version": PROFILE_VERSION,
+                    "components": {key: asdict(usage) for key, usage in self.usage.items()}}
+        tmp = f"{filename}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp, filename)
+
+
+def _dependency_order(components: List[Component]) -> List[Component]:
+    by_interface: Dict[type, List[Component]] = {}
+    for component in components:
+        for interface in component.implements:
+            by_interface.setdefault(interface, []).append(component)
+    ordered, visited = [], set()
+
+    def visit(component):
+        if component.uid in visited:
+            return
+        visited.add(component.uid)
+        for dependency, _ in component.dependencies.values():
+            if dependency.inject_immidiately and dependency.interface:
+                for child in by_interface.get(dependency.interface, []):
+                    visit(child)
+        ordered.append(component)
+
+    for component in components:
+        visit(component)
+    return ordered
+
+
+profiler = Profiler()
@@ -0,0 +1,47 @@
+from typing import Any, Callable, Dict, Type
+
+_proxy_classes: Dict[Type, Type] = {}
+
+
+class ScopedProxy:
+
+    __slots__ = ("_pydi_uid", "_pydi_get_cache", "_pydi_resolve")
+
+    def __init__(self, uid: int, get_cache: Callable[[], dict], resolve: Callable[[], Any]):
+        object.__setattr__(self, "_pydi_uid", uid)
+        object.__setattr__(self, "_pydi_get_cache", get_cache)
+        object.__setattr__(self, "_pydi_resolve", resolve)
+
+    def _pydi_target(self):
+        cache = self._pydi_get_cache()
+        if cache is not None and (instance := cache.get(self._pydi_uid)) is not None:
+            return instance
+        return self._pydi_resolve()
+
+    def __getattr__(self, item: str):
+        return getattr(self._pydi_target(), item)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._pydi_target(), name, value)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {self._pydi_target()!r}>"
+
+
+def _forward(name: str):
+    return property(lambda self: getattr(self._pydi_target(), name))
+
+
+def _interface_members(interface: Type):
+    members = set(getattr(interface, "__annotations__", {}))
+    members.update(name for name in vars(interface) if not name.startswith("_"))
+    return members
+
+
+def proxy_class(interface: Type) -> Type:
+    if (cls := _proxy_classes.get(interface)) is not None:
+        return cls
+    namespace = {name: _forward(name) for name in _interface_members(interface)}
+    namespace["__slots__"] = ()
+    cls = type(f"{interface.__name__}Proxy", (ScopedProxy,), namespace)
+    return _proxy_classes.setdefault(interface, cls)
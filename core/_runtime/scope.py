@@ -1,8 +1,15 @@
-from typing import Any
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Optional
 
 from ..base import Scope, Component
-from ..exceptions import ScopeIsNotActive, SingletonError
+from ..exceptions import ScopeIsNotActive, SingletonError, ScopeKeyError, ImproperlyConfigured, WrongInstantiating
 from .._prepare.register import register
+from .profile import profiler
+from .memory import allocation_tracker
 
 
 class BaseScope(Scope):
@@ -21,29 +28,74 @@ class BaseScope(Scope):
             factory = register.get_factory(component.factory_name)
             if factory:
                 return factory(component.cls, **kwargs)
+            if register.get_batch_factory(component.factory_name):
+                return self._get_instances(component, 1, **kwargs)[0]
         return component.cls(**kwargs)
 
+    def _get_instances(self, component: Component, count: int, **kwargs):
+        if component.factory_name:
+            batch_factory = register.get_batch_factory(component.factory_name)
+            if batch_factory:
+                instances = list(batch_factory(component.cls, count, **kwargs))
+                if len(instances) != count:
+                    raise WrongInstantiating(f"Batch factory '{component.factory_name}' returned "
+                                             f"{len(instances)} instances, {count} expected")
+                return instances
+            factory = register.get_factory(component.factory_name)
+            if factory:
+                return [factory(component.cls, **kwargs) for _ in range(count)]
+        return [component.cls(**kwargs) for _ in range(count)]
+
+    def _measured(self, create, component: Component, count: int, *args, **kwargs):
+        allocated = allocation_tracker.current() if allocation_tracker.enabled else None
+        started = time.perf_counter()
+        result = create(component, *args, **kwargs)
+        if profiler.enabled:
+            profiler.record_build(component, time.perf_counter() - started, count)
+        if allocated is not None:
+            allocation_tracker.record(component, allocation_tracker.current() - allocated, count)
+        return result
+
     def get_instance(self, component: Component, **kwargs):
         if not self._active:
             raise ScopeIsNotActive()
+        if profiler.enabled or allocation_tracker.enabled:
+            return self._measured(self._get_instance, component, 1, **kwargs)
         instance = self._get_instance(component, **kwargs)
         return instance
 
+    def get_instances(self, component: Component, count: int, **kwargs):
+        if not self._active:
+            raise ScopeIsNotActive()
+        if profiler.enabled or allocation_tracker.enabled:
+            return self._measured(self._get_instances, component, count, count, **kwargs)
+        return self._get_instances(component, count, **kwargs)
+
 
 class SingletonScope(BaseScope):
 
     def __init__(self):
         super().__init__()
         self._cache = {}
+        self._locks = {}
 
     def get_instance(self, component: Component, **kwargs):
         if kwargs:
             raise SingletonError("Singleton scope does not accept additional arguments")
         if (uid := component.uid) in self._cache:
             return self._cache[uid]
-        instance = super().get_instance(component)
-        self._cache[uid] = instance
-        return instance
+        with self._locks.setdefault(uid, threading.RLock()):
+            if uid in self._cache:
+                return self._cache[uid]
+            instance = super().get_instance(component)
+            self._cache[uid] = instance
+            return instance
+
+    def get_instances(self, component: Component, count: int, **kwargs):
+        return [self.get_instance(component, **kwargs)] * count
+
+    def cached_instances(self):
+        return iter(list(self._cache.items()))
 
 
 class PrototypeScope(BaseScope):
@@ -52,6 +104,214 @@ class PrototypeScope(BaseScope):
         return super().get_instance(component, **kwargs)
 
 
+class KeyedScope(BaseScope):
+
+    def __init__(self, *,
+                 maxsize: Optional[int] = 128,
+                 ttl: Optional[float] = None,
+                 weak: bool = False,
+                 on_evict: Optional[Callable[[Any], None]] = None):
+        super().__init__()
+        if maxsize is not None and maxsize <= 0:
+            raise ImproperlyConfigured(f"Keyed scope maxsize must be positive or None, {maxsize} given")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.weak = weak
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = OrderedDict()
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(component: Component, kwargs):
+        try:
+            key = (component.uid, frozenset(kwargs.items()))
+        except TypeError:
+            raise ScopeKeyError(f"Keyed scope requires hashable arguments, {kwargs} given") from None
+        return key
+
+    def _evict(self, key):
+        value, _ = self._cache.pop(key)
+        self._key_locks.pop(key, None)
+        self.evictions += 1
+        if self.weak:
+            value = value()
+        return value
+
+    def _dispose(self, evicted):
+        if self.on_evict:
+            for value in evicted:
+                if value is not None:
+                    self.on_evict(value)
+
+    def _lookup(self, key, evicted):
+        if key not in self._cache:
+            return None
+        value, expires = self._cache[key]
+        if expires is not None and expires <= time.monotonic():
+            evicted.append(self._evict(key))
+            return None
+        if self.weak and (value := value()) is None:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return value
+
+    def _cached(self, key):
+        evicted = []
+        with self._lock:
+            if (instance := self._lookup(key, evicted)) is not None:
+                self.hits += 1
+                key_lock = None
+            else:
+                key_lock = self._key_locks.setdefault(key, threading.Lock())
+        self._dispose(evicted)
+        return instance, key_lock
+
+    def get_instance(self, component: Component, **kwargs):
+        key = self._make_key(component, kwargs)
+        instance, key_lock = self._cached(key)
+        if instance is not None:
+            return instance
+        # only callers asking for the same key wait for the build, the scope lock guards the cache alone
+        with key_lock:
+            instance, _ = self._cached(key)
+            if instance is not None:
+                return instance
+            if self.weak and not component.cls.__weakrefoffset__:
+                raise ImproperlyConfigured(f"Component {component.cls} in weak keyed scope "
+                                           f"does not support weak references")
+            instance = super().get_instance(component, **kwargs)
+            value = instance
+            if self.weak:
+                try:
+                    value = weakref.ref(instance)
+                except TypeError:
+                    raise ImproperlyConfigured(f"Component {component.cls} in weak keyed scope "
+                                               f"does not support weak references") from None
+            expires = time.monotonic() + self.ttl if self.ttl is not None else None
+            evicted = []
+            with self._lock:
+                self.misses += 1
+                self._cache[key] = (value, expires)
+                if self.maxsize is not None:
+                    while len(self._cache) > self.maxsize:
+                        evicted.append(self._evict(next(iter(self._cache))))
+        self._dispose(evicted)
+        return instance
+
+    def get_instances(self, component: Component, count: int, **kwargs):
+        return [self.get_instance(component, **kwargs)] * count
+
+    def cached_instances(self):
+        with self._lock:
+            entries = [(key[0], value) for key, (value, _) in self._cache.items()]
+        for uid, value in entries:
+            if self.weak and (value := value()) is None:
+                continue
+            yield uid, value
+
+    def clear(self):
+        with self._lock:
+            evicted = [self._evict(key) for key in list(self._cache)]
+        self._dispose(evicted)
+
+    def stats(self):
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._cache)}
+
+
+class WeakScope(BaseScope):
+
+    def __init__(self):
+        super().__init__()
+        self._cache = {}
+        self._locks = {}
+        self.reuses = 0
+        self.builds = 0
+        self.rebuilds = 0
+
+    def _alive(self, uid: int):
+        if (ref := self._cache.get(uid)) is not None:
+            return ref()
+        return None
+
+    def get_instance(self, component: Component, **kwargs):
+        if kwargs:
+            raise SingletonError("Weak scope does not accept additional arguments")
+        uid = component.uid
+        if (instance := self._alive(uid)) is not None:
+            self.reuses += 1
+            return instance
+        with self._locks.setdefault(uid, threading.Lock()):
+            if (instance := self._alive(uid)) is not None:
+                self.reuses += 1
+                return instance
+            instance = super().get_instance(component)
+            try:
+                ref = weakref.ref(instance)
+            except TypeError:
+                raise ImproperlyConfigured(f"Component {component.cls} in weak scope "
+                                           f"does not support weak references") from None
+            if uid in self._cache:
+                self.rebuilds += 1
+            else:
+                self.builds += 1
+            self._cache[uid] = ref
+            return instance
+
+    def get_instances(self, component: Component, count: int, **kwargs):
+        return [self.get_instance(component, **kwargs)] * count
+
+    def cached_instances(self):
+        for uid, ref in list(self._cache.items()):
+            if (instance := ref()) is not None:
+                yield uid, instance
+
+    def stats(self):
+        return {"reuses": self.reuses,
+                "builds": self.builds,
+                "rebuilds": self.rebuilds,
+                "alive": sum(1 for ref in list(self._cache.values()) if ref() is not None)}
+
+
+class ContextScope(BaseScope):
+
+    def __init__(self, name: str):
+        super().__init__()
+        self._cache_var: ContextVar[Optional[dict]] = ContextVar(f"pydi_{name}_scope", default=None)
+        self.get_cache = self._cache_var.get
+
+    def open(self) -> Token:
+        return self._cache_var.set({})
+
+    def close(self, token: Token):
+        self._cache_var.reset(token)
+
+    def get_instance(self, component: Component, **kwargs):
+        if kwargs:
+            raise SingletonError("Context scope does not accept additional arguments")
+        cache = self.get_cache()
+        if cache is None:
+            raise ScopeIsNotActive(f"Scope for component {component.cls} is not open in the current context")
+        if (uid := component.uid) in cache:
+            return cache[uid]
+        instance = super().get_instance(component)
+        cache[uid] = instance
+        return instance
+
+    def get_instances(self, component: Component, count: int, **kwargs):
+        return [self.get_instance(component, **kwargs)] * count
+
+    def cached_instances(self):
+        return iter(list((self.get_cache() or {}).items()))
+
+
 _singletonScope = SingletonScope()
 _singletonScope.enter()
 register.register_scope("singleton", _singletonScope)
@@ -59,3 +319,15 @@ register.register_scope("singleton", _singletonScope)
 _prototypeScope = PrototypeScope()
 _prototypeScope.enter()
 register.register_scope("prototype", _prototypeScope)
+
+_keyedScope = KeyedScope()
+_keyedScope.enter()
+register.register_scope("keyed", _keyedScope)
+
+_weakScope = WeakScope()
+_weakScope.enter()
+register.register_scope("weak", _weakScope)
+
+_requestScope = ContextScope("request")
+_requestScope.enter()
+register.register_scope("request", _requestScope)
@@ -0,0 +1,107 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    thread_id: int
+    end: Optional[float] = None
+    args: Dict[str, Any] = field(default_factory=dict)
+    children: List["Span"] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+
+class Tracer:
+
+    def __init__(self):
+        self.enabled = False
+        self.roots: List[Span] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def clear(self):
+        with self._lock:
+            self.roots = []
+
+    @contextmanager
+    def span(self, name: str, **args) -> Iterator[Optional[Span]]:
+        if not self.enabled:
+            yield None
+            return
+        if (stack := getattr(self._local, "stack", None)) is None:
+            stack = self._local.stack = []
+        span = Span(name=name, start=time.perf_counter(), thread_id=threading.get_ident(), args=args)
+        if stack:
+            stack[-1].children.append(span)
+        else:
+            with self._lock:
+                self.roots.append(span)
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter()
+            stack.pop()
+
+    def to_collapsed(self) -> str:
+        weights: Dict[str, int] = {}
+
+        def walk(span: Span, path: str):
+            path = f"{path};{span.name}" if path else span.name
+            own = span.duration - sum(child.duration for child in span.children)
+            weights[path] = weights.get(path, 0) + max(int(own * 1_000_000), 0)
+            for child in span.children:
+                walk(child, path)
+
+        for root in list(self.roots):
+            walk(root, "")
+        return "\n".join(f"{path} {weight}" for path, weight in weights.items() if weight)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        roots = list(self.roots)
+        origin = min((root.start for root in roots), default=0.0)
+        pid = os.getpid()
+        events = []
+
+        def walk(span: Span):
+            events.append({"name": span.name,
+                           "ph": "X",
+                           "ts": (span.start - origin) * 1_000_000,
+                           "dur": span.duration * 1_000_000,
+                           "pid": pid,
+                           "tid": span.thread_id,
+                           "args": span.args})
+            for child in span.children:
+                walk(child)
+
+        for root in roots:
+            walk(root)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_collapsed(self, filename: str):
+        with open(filename, "w") as f:
+            f.write(self.to_collapsed())
+            f.write("\n")
+
+    def export_chrome_trace(self, filename: str):
+        with open(filename, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+tracer = Tracer()
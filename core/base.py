@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, _ProtocolMeta, Type, List, Dict, Optional, Set, TypeVar, Generic, Tuple
+from typing import Any, _ProtocolMeta, Type, List, Dict, Optional, Set, TypeVar, Generic, Tuple, Iterator
 from .exceptions import FinishedSingletonUsage
 
 ALL = "all"
@@ -15,6 +15,11 @@ class Dependency:
     is_volatile: bool = False
     inject_immidiately: bool = False
     use_strategy: bool = False
+    prefetch: bool = False
+    is_scoped: bool = False
+    config_key: Optional[str] = None
+    config_type: Optional[Type] = None
+    value: Any = None
 
 
 @dataclass
@@ -74,6 +79,12 @@ class Scope(ABC):
     def get_instance(self, component: Component, **kwargs):
         pass
 
+    def get_instances(self, component: Component, count: int, **kwargs):
+        return [self.get_instance(component, **kwargs) for _ in range(count)]
+
+    def cached_instances(self) -> Iterator[Tuple[int, Any]]:
+        return iter(())
+
 
 T = TypeVar('T', bound=_ProtocolMeta)
 
@@ -86,6 +97,14 @@ class Volatile(Generic[T]):
     pass
 
 
+class Prefetch(Generic[T]):
+    pass
+
+
+class Scoped(Generic[T]):
+    pass
+
+
 Col = TypeVar("Col", List, Set, Tuple)
 
 
@@ -95,3 +114,10 @@ class Group(Generic[T, Col]):
 
 class Strategy(Generic[T]):
     pass
+
+
+V = TypeVar("V")
+
+
+class Value(Generic[T, V]):
+    pass
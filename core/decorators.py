@@ -1,7 +1,12 @@
-from typing import _ProtocolMeta, Union, List, Type, Optional
+import functools
+import inspect
+from typing import _ProtocolMeta, Union, List, Type, Optional, Callable
 from .base import Component, ALL
-from .exceptions import ImproperlyConfigured
-from ._prepare.register import register
+from .exceptions import ImproperlyConfigured, NotStarted
+from ._prepare.register import register, Register
+from ._build.builder import get_dependency_builder
+from ._runtime.context import context
+from ._runtime.scope import SingletonScope
 
 
 def interface(cls: Type):
@@ -67,9 +72,61 @@ def strategy(group_name: str):
     return wrapper
 
 
-def factory(factory_name: str):
+def factory(factory_name: str, batch: bool = False):
 
     def wrapper(func):
-        register.register_factory(factory_name, func)
+        if batch:
+            register.register_batch_factory(factory_name, func)
+        else:
+            register.register_factory(factory_name, func)
         return func
     return wrapper
+
+
+def _is_singleton(scope) -> bool:
+    return isinstance(scope, SingletonScope)
+
+
+def _compile_injection_plan(signature: inspect.Signature):
+    if not Register._finished:
+        raise NotStarted("Functions decorated with @inject can be called only after start()")
+    plan = []
+    for position, (name, parameter) in enumerate(signature.parameters.items()):
+        if parameter.kind not in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY):
+            continue
+        if parameter.annotation is parameter.empty:
+            continue
+        dependency_builder = get_dependency_builder(parameter.annotation)
+        if not dependency_builder:
+            continue
+        dependency = dependency_builder.dependency()
+        if parameter.kind is parameter.KEYWORD_ONLY:
+            position = None
+        plan.append((name, position, context.injector._resolver(dependency, _is_singleton)))
+    return plan
+
+
+def inject(func: Callable):
+    signature = inspect.signature(func)
+    plan = None
+
+    def resolve(args, kwargs):
+        nonlocal plan
+        if plan is None:
+            plan = _compile_injection_plan(signature)
+        for name, position, resolver in plan:
+            if name in kwargs or (position is not None and position < len(args)):
+                continue
+            kwargs[name] = resolver()
+        return kwargs
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            return await func(*args, **resolve(args, kwargs))
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **resolve(args, kwargs))
+    return wrapper
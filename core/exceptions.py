@@ -58,5 +58,9 @@ class SingletonError(WrongInstantiating):
     pass
 
 
+class ScopeKeyError(WrongInstantiating):
+    pass
+
+
 class AttributeWasNotInjected(Exception):
     pass
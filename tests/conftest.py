@@ -0,0 +1,28 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load_pydi():
+    for name in [n for n in sys.modules if n == "pydi" or n.startswith("pydi.")]:
+        del sys.modules[name]
+    spec = importlib.util.spec_from_file_location("pydi", os.path.join(ROOT, "__init__.py"),
+                                                  submodule_search_locations=[ROOT])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["pydi"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def pydi():
+    return _load_pydi()
+
+
+@pytest.fixture
+def load_pydi():
+    return _load_pydi
@@ -0,0 +1,67 @@
+from typing import Protocol
+
+import pytest
+
+
+def test_bulk_uses_batch_factory_and_resolves_shared_dependencies_once(pydi, monkeypatch):
+    from pydi.core._runtime.context import context
+
+    @pydi.interface
+    class IPool(Protocol):
+        ...
+
+    @pydi.interface
+    class ISession(Protocol):
+        ...
+
+    @pydi.interface
+    class IWorker(Protocol):
+        ...
+
+    @pydi.component(IPool, scope="singleton")
+    class Pool:
+        ...
+
+    @pydi.component(ISession, scope="prototype")
+    class Session:
+        ...
+
+    calls = []
+
+    @pydi.factory("workers", batch=True)
+    def make_workers(cls, count):
+        calls.append(count)
+        return [cls() for _ in range(count)]
+
+    @pydi.component(IWorker, scope="prototype", factory_name="workers")
+    class Worker:
+        pool: IPool
+        session: ISession
+
+    pydi.start()
+    resolved = []
+    original = context._get_instance
+    monkeypatch.setattr(context, "_get_instance",
+                        lambda component, **kwargs: resolved.append(component.cls) or original(component, **kwargs))
+    workers = pydi.get_context().get_instances_bulk(interface=IWorker, count=3)
+    assert calls == [3]
+    assert len({id(w) for w in workers}) == 3
+    assert len({id(w.pool) for w in workers}) == 1
+    assert len({id(w.session) for w in workers}) == 3
+    assert [cls.__name__ for cls in resolved].count("Pool") == 1
+
+
+def test_bulk_rejects_negative_count(pydi):
+    from pydi.core.exceptions import IllegalContextCall
+
+    @pydi.interface
+    class IWorker(Protocol):
+        ...
+
+    @pydi.component(IWorker, scope="prototype")
+    class Worker:
+        ...
+
+    pydi.start()
+    with pytest.raises(IllegalContextCall):
+        pydi.get_context().get_instances_bulk(interface=IWorker, count=-1)
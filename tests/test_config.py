@@ -0,0 +1,62 @@
+import json
+from typing import Protocol
+
+
+def test_value_is_injected_into_component(pydi, tmp_path):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"db": {"host": "localhost", "port": "5432"}}))
+    pydi.add_file_config(str(config_file))
+
+    @pydi.interface
+    class IService(Protocol):
+        ...
+
+    @pydi.component(IService, scope="singleton")
+    class Service:
+        host: pydi.Value["db.host", str]
+        port: pydi.Value["db.port", int]
+
+    pydi.start()
+    service = pydi.get_context().get_instance(interface=IService)
+    assert service.host == "localhost"
+    assert service.port == 5432
+
+
+def test_value_is_passed_to_injected_function(pydi, tmp_path):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"db": {"port": "5432"}}))
+    pydi.add_file_config(str(config_file))
+
+    @pydi.inject
+    def handler(port: pydi.Value["db.port", int]):
+        return port
+
+    pydi.start()
+    assert handler() == 5432
+    assert handler(port=1) == 1
+
+
+def test_generic_value_types_are_checked_by_origin(pydi, tmp_path):
+    from pydi.core.exceptions import ImproperlyConfigured
+    from pydi.core._runtime.config import config
+    from typing import Dict, List
+    import pytest
+
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"db": {"hosts": [1, 2]}}))
+    pydi.add_file_config(str(config_file))
+    config.load()
+    assert config.get_value("db.hosts", List[int]) == [1, 2]
+    with pytest.raises(ImproperlyConfigured):
+        config.get_value("db.hosts", Dict[str, int])
+
+
+def test_loaded_values_do_not_share_parse_cache(pydi, tmp_path):
+    from pydi.core._runtime.config import config, parse_file
+
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"db": {"hosts": [1, 2]}}))
+    pydi.add_file_config(str(config_file))
+    config.load()
+    config.get_value("db.hosts").append(3)
+    assert parse_file(str(config_file))["db"]["hosts"] == [1, 2]
@@ -0,0 +1,32 @@
+from typing import List, Protocol
+
+
+def test_interface_and_collection_dependencies_are_injected(pydi):
+
+    @pydi.interface
+    class IRepo(Protocol):
+        ...
+
+    @pydi.interface
+    class IService(Protocol):
+        ...
+
+    @pydi.component(IRepo, scope="singleton")
+    class Repo:
+        ...
+
+    @pydi.component(IService, scope="prototype")
+    class Service:
+        repo: IRepo
+        repos: List[IRepo]
+        lazy_repo: pydi.Lazy[IRepo]
+        limit: int
+
+    pydi.start()
+    context = pydi.get_context()
+    repo = context.get_instance(interface=IRepo)
+    service = context.get_instance(interface=IService)
+    assert service.repo is repo
+    assert service.repos == [repo]
+    assert "lazy_repo" not in service.__dict__
+    assert service.lazy_repo is repo
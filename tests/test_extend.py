@@ -0,0 +1,87 @@
+from typing import Protocol
+
+import pytest
+
+
+def test_loaded_components_are_visible_and_singletons_are_kept(pydi):
+    built = []
+
+    @pydi.interface
+    class IRepo(Protocol):
+        ...
+
+    @pydi.component(IRepo, scope="singleton")
+    class Repo:
+        def __init__(self):
+            built.append(type(self))
+
+    pydi.start()
+    context = pydi.get_context()
+    repo = context.get_instance(interface=IRepo)
+
+    @pydi.interface
+    class IPlugin(Protocol):
+        ...
+
+    @pydi.component(IPlugin, scope="singleton", name="plugin", group="plugins")
+    class Plugin:
+        repo: IRepo
+
+    assert pydi.load_components() == [Plugin]
+    plugin = context.get_instance(interface=IPlugin)
+    assert context.get_instance(name="plugin") is plugin
+    assert list(context.get_instances(group="plugins")) == [plugin]
+    assert plugin.repo is repo
+    assert context.get_instance(interface=IRepo) is repo
+    assert built == [Repo]
+
+
+def test_redeclaring_an_interface_keeps_its_components(pydi):
+    @pydi.interface
+    class IRepo(Protocol):
+        ...
+
+    @pydi.component(IRepo, scope="singleton")
+    class Repo:
+        ...
+
+    pydi.start()
+    pydi.interface(IRepo)
+    assert isinstance(pydi.get_context().get_instance(interface=IRepo), Repo)
+
+
+@pytest.mark.parametrize("options", [{"name": "repo"}, {"scope": "missing"}])
+def test_failing_batch_is_dropped_and_previous_snapshot_stays(pydi, options):
+    from pydi.core._prepare.register import register
+    from pydi.core.exceptions import MoreThanOneCandidateFound, NoCandidatesFound, ScopeNotFound
+
+    @pydi.interface
+    class IRepo(Protocol):
+        ...
+
+    @pydi.component(IRepo, scope="singleton", name="repo")
+    class Repo:
+        ...
+
+    pydi.start()
+    context = pydi.get_context()
+    snapshot = (register.interfaces, register.named_components, register.groups, register.components)
+
+    @pydi.interface
+    class ICache(Protocol):
+        ...
+
+    @pydi.component(ICache, **{"scope": "singleton", **options})
+    class Cache:
+        ...
+
+    with pytest.raises((MoreThanOneCandidateFound, ScopeNotFound)):
+        pydi.load_components()
+    assert register.named_components is snapshot[1]
+    assert register.groups is snapshot[2]
+    assert register.components is snapshot[3]
+    assert register.interfaces[ICache] == []
+    assert context.get_instance(name="repo") is context.get_instance(interface=IRepo)
+    with pytest.raises(NoCandidatesFound):
+        context.get_instance(interface=ICache)
+    assert pydi.load_components() == []
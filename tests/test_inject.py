@@ -0,0 +1,67 @@
+import asyncio
+from typing import Protocol
+
+import pytest
+
+
+def _declare(pydi):
+
+    @pydi.interface
+    class IRepo(Protocol):
+        ...
+
+    @pydi.interface
+    class ISession(Protocol):
+        ...
+
+    @pydi.component(IRepo, scope="singleton")
+    class Repo:
+        ...
+
+    @pydi.component(ISession, scope="prototype")
+    class Session:
+        ...
+
+    return IRepo, ISession
+
+
+def test_inject_fills_missing_arguments(pydi):
+    IRepo, ISession = _declare(pydi)
+
+    @pydi.inject
+    def handler(value, repo: IRepo, *, session: ISession):
+        return value, repo, session
+
+    @pydi.inject
+    async def async_handler(repo: IRepo):
+        return repo
+
+    with pytest.raises(pydi.NotStarted):
+        handler(1)
+    pydi.start()
+    context = pydi.get_context()
+    repo = context.get_instance(interface=IRepo)
+    value, injected_repo, session = handler(1)
+    assert (value, injected_repo) == (1, repo)
+    assert handler(1)[2] is not session
+    assert handler(1, "given")[1] == "given"
+    assert asyncio.run(async_handler()) is repo
+
+
+def test_inject_caches_singletons_in_plan(pydi, monkeypatch):
+    from pydi.core._runtime.context import context
+
+    IRepo, ISession = _declare(pydi)
+
+    @pydi.inject
+    def handler(repo: IRepo, session: ISession):
+        return repo, session
+
+    pydi.start()
+    handler()
+    resolved = []
+    original = context._get_instance
+    monkeypatch.setattr(context, "_get_instance",
+                        lambda component, **kwargs: resolved.append(component.cls) or original(component, **kwargs))
+    handler()
+    assert [cls.__name__ for cls in resolved] == ["Session"]
@@ -0,0 +1,115 @@
+from typing import Protocol
+
+import pytest
+
+
+def test_keyed_scope_caches_by_arguments_with_lru_eviction(pydi):
+    evicted = []
+    pydi.add_scope("tenants", pydi.KeyedScope(maxsize=2, on_evict=evicted.append))
+
+    @pydi.interface
+    class ITenant(Protocol):
+        ...
+
+    @pydi.component(ITenant, scope="tenants")
+    class Tenant:
+        def __init__(self, tenant_id):
+            self.tenant_id = tenant_id
+
+    pydi.start()
+    context = pydi.get_context()
+    first = context.get_instance(interface=ITenant, tenant_id=1)
+    assert context.get_instance(interface=ITenant, tenant_id=1) is first
+    context.get_instance(interface=ITenant, tenant_id=2)
+    context.get_instance(interface=ITenant, tenant_id=3)
+    assert evicted == [first]
+
+
+def test_weak_keyed_scope_rejects_unreferenceable_components(pydi):
+    from pydi.core.exceptions import ImproperlyConfigured
+
+    scope = pydi.KeyedScope(weak=True)
+    pydi.add_scope("weak_tenants", scope)
+
+    @pydi.interface
+    class ITenant(Protocol):
+        ...
+
+    @pydi.component(ITenant, scope="weak_tenants")
+    class Tenant:
+        __slots__ = ("tenant_id",)
+
+        def __init__(self, tenant_id):
+            self.tenant_id = tenant_id
+
+    pydi.start()
+    with pytest.raises(ImproperlyConfigured):
+        pydi.get_context().get_instance(interface=ITenant, tenant_id=1)
+    assert scope.stats()["misses"] == 0
+
+
+def test_keyed_scope_expires_entries_and_counts_hits_misses_evictions(pydi, monkeypatch):
+    from pydi.core._runtime import scope as scope_module
+
+    now = [100.0]
+    monkeypatch.setattr(scope_module.time, "monotonic", lambda: now[0])
+    evicted = []
+    scope = pydi.KeyedScope(maxsize=None, ttl=10, on_evict=evicted.append)
+    pydi.add_scope("sessions", scope)
+
+    @pydi.interface
+    class ISession(Protocol):
+        ...
+
+    @pydi.component(ISession, scope="sessions")
+    class Session:
+        def __init__(self, user):
+            self.user = user
+
+    pydi.start()
+    context = pydi.get_context()
+    first = context.get_instance(interface=ISession, user="a")
+    now[0] += 5
+    assert context.get_instance(interface=ISession, user="a") is first
+    now[0] += 10
+    second = context.get_instance(interface=ISession, user="a")
+    assert second is not first
+    assert evicted == [first]
+    assert scope.stats() == {"hits": 1, "misses": 2, "evictions": 1, "size": 1}
+
+
+def test_keyed_scope_builds_other_keys_while_one_is_building(pydi):
+    import threading
+
+    scope = pydi.KeyedScope()
+    pydi.add_scope("slow", scope)
+    building = threading.Event()
+    release = threading.Event()
+
+    @pydi.interface
+    class IConnection(Protocol):
+        ...
+
+    @pydi.component(IConnection, scope="slow")
+    class Connection:
+        def __init__(self, host):
+            if host == "slow":
+                building.set()
+                release.wait(5)
+            self.host = host
+
+    pydi.start()
+    context = pydi.get_context()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(context.get_instance(interface=IConnection,
+                                                                                    host="slow")))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    assert building.wait(5)
+    assert context.get_instance(interface=IConnection, host="fast").host == "fast"
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(results) == 2 and results[0] is results[1]
+    assert scope.stats()["misses"] == 2
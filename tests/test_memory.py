@@ -0,0 +1,89 @@
+import csv
+import io
+import json
+import sys
+from typing import Protocol
+
+
+def test_deep_sizeof_counts_shared_objects_once(pydi):
+    from pydi.core._runtime.memory import deep_sizeof
+
+    shared = list(range(100))
+    single = deep_sizeof(shared, set())
+    assert deep_sizeof([shared, shared], set()) == sys.getsizeof([shared, shared], 0) + single
+    assert deep_sizeof(shared, {id(shared)}) == 0
+
+
+def test_memory_report_excludes_other_cached_components(pydi):
+    @pydi.interface
+    class IRepo(Protocol):
+        ...
+
+    @pydi.interface
+    class IService(Protocol):
+        ...
+
+    @pydi.component(IRepo, scope="singleton")
+    class Repo:
+        def __init__(self):
+            self.rows = [str(i) for i in range(1000)]
+
+    @pydi.component(IService, scope="singleton")
+    class Service:
+        repo: IRepo
+
+    pydi.start()
+    pydi.get_context().get_instance(interface=IService)
+    report = pydi.memory_report()
+    entries = {entry.component.rsplit(".", 1)[-1]: entry for entry in report.components}
+    assert [entry.component.rsplit(".", 1)[-1] for entry in report.components] == ["Repo", "Service"]
+    assert entries["Repo"].retained_size > 1000 * sys.getsizeof("0")
+    assert entries["Service"].retained_size < entries["Repo"].retained_size // 10
+    assert report.scopes == {"singleton": report.total}
+
+    rows = list(csv.DictReader(io.StringIO(report.to_csv())))
+    assert [row["component"] for row in rows] == [entry.component for entry in report.components]
+    assert int(rows[0]["retained_size"]) == entries["Repo"].retained_size
+    data = json.loads(report.to_json())
+    assert data["total"] == report.total
+    assert data["components"][0]["instances"] == 1
+
+
+def test_allocation_tracker_keeps_per_build_figures(pydi):
+    from pydi.core.base import Component
+    from pydi.core._runtime.memory import allocation_tracker
+
+    class Buffer:
+        ...
+
+    component = Component(cls=Buffer, scope="prototype", uid=-1)
+    allocation_tracker.record(component, 300, 3)
+    allocation_tracker.record(component, 500)
+    allocation = allocation_tracker.allocations[-1]
+    assert (allocation.last, allocation.peak, allocation.builds) == (500, 500, 4)
+    allocation_tracker.record(component, 200)
+    assert (allocation.last, allocation.peak, allocation.builds) == (200, 500, 5)
+
+
+def test_memory_report_includes_tracked_prototype_builds(pydi):
+    @pydi.interface
+    class IBuffer(Protocol):
+        ...
+
+    @pydi.component(IBuffer, scope="prototype")
+    class Buffer:
+        def __init__(self):
+            self.data = bytearray(10_000)
+
+    pydi.start()
+    pydi.track_allocations()
+    try:
+        context = pydi.get_context()
+        buffers = [context.get_instance(interface=IBuffer) for _ in range(3)]
+    finally:
+        pydi.track_allocations(False)
+    entry, = pydi.memory_report().components
+    assert entry.builds == 3
+    assert entry.instances == 0
+    assert 10_000 <= entry.allocated_size <= entry.allocated_peak < 3 * 10_000
+    assert len(buffers) == 3
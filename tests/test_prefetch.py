@@ -0,0 +1,83 @@
+import time
+from typing import Protocol
+
+
+def test_prefetched_singleton_is_built_once(pydi):
+
+    @pydi.interface
+    class IHeavy(Protocol):
+        ...
+
+    @pydi.interface
+    class IOwner(Protocol):
+        ...
+
+    built = []
+
+    @pydi.component(IHeavy, scope="singleton")
+    class Heavy:
+        def __init__(self):
+            built.append(self)
+            time.sleep(0.05)
+
+    @pydi.component(IOwner, scope="prototype")
+    class Owner:
+        heavy: pydi.Lazy[pydi.Prefetch[IHeavy]]
+
+    pydi.start()
+    context = pydi.get_context()
+    owner = context.get_instance(interface=IOwner)
+    direct = context.get_instance(interface=IHeavy)
+    assert owner.heavy is direct
+    assert len(built) == 1
+
+
+def test_prefetch_runs_in_callers_context(pydi):
+
+    @pydi.interface
+    class IRequest(Protocol):
+        ...
+
+    @pydi.interface
+    class IOwner(Protocol):
+        ...
+
+    @pydi.component(IRequest, scope="request")
+    class Request:
+        ...
+
+    @pydi.component(IOwner, scope="prototype")
+    class Owner:
+        request: pydi.Lazy[pydi.Prefetch[IRequest]]
+
+    pydi.start()
+    context = pydi.get_context()
+    with pydi.scope():
+        owner = context.get_instance(interface=IOwner)
+        assert owner.request is context.get_instance(interface=IRequest)
+
+
+def test_prefetch_exception_is_raised_on_access(pydi):
+    import pytest
+
+    @pydi.interface
+    class IBroken(Protocol):
+        ...
+
+    @pydi.interface
+    class IOwner(Protocol):
+        ...
+
+    @pydi.component(IBroken, scope="singleton")
+    class Broken:
+        def __init__(self):
+            raise RuntimeError("boom")
+
+    @pydi.component(IOwner, scope="prototype")
+    class Owner:
+        broken: pydi.Lazy[pydi.Prefetch[IBroken]]
+
+    pydi.start()
+    owner = pydi.get_context().get_instance(interface=IOwner)
+    with pytest.raises(RuntimeError, match="boom"):
+        owner.broken
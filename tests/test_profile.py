@@ -0,0 +1,70 @@
+from typing import Protocol
+
+
+def _declare(pydi, built):
+    @pydi.interface
+    class IService(Protocol):
+        ...
+
+    @pydi.interface
+    class IRepo(Protocol):
+        ...
+
+    @pydi.interface
+    class ICold(Protocol):
+        ...
+
+    @pydi.interface
+    class IHandler(Protocol):
+        ...
+
+    @pydi.component(IService, scope="singleton")
+    class Service:
+        repo: IRepo
+
+        def __init__(self):
+            built.append("Service")
+
+    @pydi.component(IRepo, scope="singleton")
+    class Repo:
+        def __init__(self):
+            built.append("Repo")
+
+    @pydi.component(ICold, scope="singleton")
+    class Cold:
+        def __init__(self):
+            built.append("Cold")
+
+    @pydi.component(IHandler, scope="prototype")
+    class Handler:
+        def __init__(self):
+            built.append("Handler")
+
+    return IService, IHandler
+
+
+def test_hot_singletons_from_previous_run_are_built_on_start(load_pydi, tmp_path):
+    profile = str(tmp_path / "profile.json")
+
+    pydi = load_pydi()
+    built = []
+    IService, IHandler = _declare(pydi, built)
+    pydi.start(profile=profile)
+    assert built == []
+    context = pydi.get_context()
+    context.get_instance(interface=IService)
+    context.get_instance(interface=IHandler)
+    pydi.save_profile()
+
+    pydi = load_pydi()
+    from pydi.core._runtime.profile import profiler
+
+    built = []
+    IService, _ = _declare(pydi, built)
+    pydi.start(profile=profile)
+    assert built == ["Repo", "Service"]
+    assert all(usage.resolutions == 0 for usage in profiler.usage.values())
+    pydi.get_context().get_instance(interface=IService)
+    assert built == ["Repo", "Service"]
+    assert {key.rsplit(".", 1)[-1]: usage.resolutions for key, usage in profiler.usage.items()} == \
+        {"Repo": 1, "Service": 1}
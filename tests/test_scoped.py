@@ -0,0 +1,81 @@
+from typing import Protocol
+
+import pytest
+
+
+def _declare(pydi):
+
+    @pydi.interface
+    class IRequest(Protocol):
+        user: str
+
+    @pydi.interface
+    class IService(Protocol):
+        ...
+
+    counter = [0]
+
+    @pydi.component(IRequest, scope="request")
+    class Request:
+        def __init__(self):
+            counter[0] += 1
+            self.user = f"user{counter[0]}"
+
+    @pydi.component(IService, scope="singleton")
+    class Service:
+        request: pydi.Scoped[IRequest]
+
+    return IRequest, IService
+
+
+def test_singleton_reads_request_scoped_instance_through_proxy(pydi):
+    from pydi.core.exceptions import ScopeIsNotActive
+
+    IRequest, IService = _declare(pydi)
+    pydi.start()
+    context = pydi.get_context()
+    service = context.get_instance(interface=IService)
+    with pydi.scope():
+        request = context.get_instance(interface=IRequest)
+        assert service.request.user == request.user
+    with pydi.scope():
+        assert service.request.user != request.user
+    with pytest.raises(ScopeIsNotActive):
+        service.request.user
+
+
+def test_bulk_resolution_reuses_request_cache(pydi):
+    IRequest, _ = _declare(pydi)
+    pydi.start()
+    context = pydi.get_context()
+    with pydi.scope():
+        request = context.get_instance(interface=IRequest)
+        assert context.get_instances_bulk(interface=IRequest, count=2) == [request, request]
+
+
+def test_proxy_is_shared_between_injections(pydi):
+    IRequest, _ = _declare(pydi)
+
+    @pydi.interface
+    class IHandler(Protocol):
+        ...
+
+    @pydi.component(IHandler, scope="prototype")
+    class Handler:
+        request: pydi.Scoped[IRequest]
+
+    pydi.start()
+    context = pydi.get_context()
+    first = context.get_instance(interface=IHandler)
+    second = context.get_instance(interface=IHandler)
+    assert first.request is second.request
+
+
+@pytest.mark.parametrize("name", ["singleton", "missing"])
+def test_scope_rejects_names_of_non_context_scopes(pydi, name):
+    from pydi.core.exceptions import ScopeNotFound
+
+    pydi.start()
+    with pytest.raises(ScopeNotFound):
+        with pydi.scope(name):
+            ...
@@ -0,0 +1,35 @@
+from typing import Protocol
+
+import pytest
+
+
+def test_sealed_start_installs_non_data_descriptors(pydi):
+    from pydi.core._build.builder import SealedDependency
+    from pydi.core.exceptions import AttributeWasNotInjected
+
+    @pydi.interface
+    class IRepo(Protocol):
+        ...
+
+    @pydi.interface
+    class IService(Protocol):
+        ...
+
+    @pydi.component(IRepo, scope="singleton")
+    class Repo:
+        ...
+
+    @pydi.component(IService, scope="prototype")
+    class Service:
+        repo: IRepo
+
+    pydi.start(sealed=True)
+    descriptor = Service.__dict__["repo"]
+    assert isinstance(descriptor, SealedDependency)
+    assert not hasattr(descriptor, "__set__")
+
+    context = pydi.get_context()
+    service = context.get_instance(interface=IService)
+    assert service.repo is context.get_instance(interface=IRepo)
+    with pytest.raises(AttributeWasNotInjected):
+        Service().repo
@@ -0,0 +1,30 @@
+import json
+from typing import Protocol
+
+
+def test_tracer_records_build_phases_and_resolutions(pydi, tmp_path):
+
+    @pydi.interface
+    class IWorker(Protocol):
+        ...
+
+    @pydi.component(IWorker, scope="prototype")
+    class Worker:
+        ...
+
+    pydi.tracer.enable()
+    pydi.start()
+    context = pydi.get_context()
+    context.get_instance(interface=IWorker)
+    context.get_instances_bulk(interface=IWorker, count=2)
+
+    names = [event["name"] for event in pydi.tracer.to_chrome_trace()["traceEvents"]]
+    assert "start" in names
+    assert "_build_dependencies" in names
+    resolutions = [event for event in pydi.tracer.to_chrome_trace()["traceEvents"]
+                   if event["name"].endswith("Worker")]
+    assert [event["args"].get("count") for event in resolutions] == [None, 2]
+
+    pydi.tracer.export_chrome_trace(str(tmp_path / "trace.json"))
+    assert json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in pydi.tracer.to_collapsed().splitlines())
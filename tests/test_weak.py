@@ -0,0 +1,59 @@
+import gc
+import threading
+import time
+from typing import Protocol
+
+
+def _declare_buffer(pydi, built):
+    @pydi.interface
+    class IBuffer(Protocol):
+        ...
+
+    @pydi.component(IBuffer, scope="weak")
+    class Buffer:
+        def __init__(self):
+            time.sleep(0.01)
+            built.append(self)
+
+    return IBuffer
+
+
+def test_weak_scope_reuses_while_held_and_rebuilds_after_collection(pydi):
+    from pydi.core._runtime.scope import _weakScope
+
+    built = []
+    IBuffer = _declare_buffer(pydi, built)
+    pydi.start()
+    context = pydi.get_context()
+    holder = context.get_instance(interface=IBuffer)
+    assert context.get_instance(interface=IBuffer) is holder
+    assert _weakScope.stats() == {"reuses": 1, "builds": 1, "rebuilds": 0, "alive": 1}
+
+    del holder
+    built.clear()
+    gc.collect()
+    assert _weakScope.stats()["alive"] == 0
+    rebuilt = context.get_instance(interface=IBuffer)
+    assert built == [rebuilt]
+    assert _weakScope.stats() == {"reuses": 1, "builds": 1, "rebuilds": 1, "alive": 1}
+
+
+def test_weak_scope_builds_one_instance_for_concurrent_callers(pydi):
+    built = []
+    IBuffer = _declare_buffer(pydi, built)
+    pydi.start()
+    context = pydi.get_context()
+    barrier = threading.Barrier(8)
+    results = []
+
+    def resolve():
+        barrier.wait()
+        results.append(context.get_instance(interface=IBuffer))
+
+    threads = [threading.Thread(target=resolve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(built) == 1
+    assert all(result is built[0] for result in results)